@@ -199,13 +199,18 @@ class test_run_class:
 		elif reset_type == "console reboot":
 			rcode = self.do_ttc("run reboot")
 		elif reset_type == "reboot":
-			rcode = self.do_ttc("reboot")
+			rcode = self.do_ttc("reboot -w")
 		elif reset_type == "manual":
 			print "*** Manual reset required - please reset the board and hit <enter>"
 			sys.stdin.readline()
 		else:
 			print "Unsupported board_reset value - %s" % reset_type
 
+		# 'ttc reset -w' and 'ttc reboot -w' wait until the board is ready
+		# (if they fail, fall back to sleeping)
+		if reset_type in ["reset", "reboot"] and rcode == 0:
+			return
+
 		# wait a bit
 		reset_timeout = int(self.get_target_value("reset_timeout", reset_timeout_default))
 		print "  Sleeping %d seconds to wait for board to reset" % reset_timeout